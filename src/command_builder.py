@@ -1,13 +1,28 @@
 import os
 import json
 import platform
-from typing import Dict, Optional, Tuple
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
-from rich.theme import Theme
-from rich.text import Text
-from rich.padding import Padding
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dump_json(data: Dict) -> bytes:
+    """
+    Serialize data to indented UTF-8 JSON, using orjson when it is installed.
+
+    Args:
+        data (Dict): Data to serialize
+
+    Returns:
+        bytes: Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
 
 
 class CommandBuilder:
@@ -18,23 +33,34 @@ class CommandBuilder:
     def __init__(self, target_directory: str = "./prj_mem/"):
         self.target_directory = target_directory
         self.shell_type = "powershell" if platform.system() == "Windows" else "bash"
-        self.console = Console(
-            theme=Theme(
-                {
-                    "info": "cyan",
-                    "warning": "yellow",
-                    "error": "red bold",
-                    "success": "green bold",
-                }
-            )
-        )
+        self._theme_dict = {
+            "info": "cyan",
+            "warning": "yellow",
+            "error": "red bold",
+            "success": "green bold",
+        }
+        self._existing_dirs = set()
+
+    @cached_property
+    def console(self):
+        """Rich console, built on first use so importing this module stays cheap."""
+        from ui import Console, Theme
+
+        return Console(theme=Theme(self._theme_dict))
+
+    @cached_property
+    def _header_panel(self):
+        """Header panel, built once and reused on every display."""
+        from ui import Panel, Text
 
-    def display_header(self):
-        """Display a header for the command builder."""
         header_text = Text()
         header_text.append("📝 ", style="bold yellow")
         header_text.append("Command Builder", style="bold blue")
-        self.console.print(Panel(header_text, border_style="blue"))
+        return Panel(header_text, border_style="blue")
+
+    def display_header(self):
+        """Display a header for the command builder."""
+        self.console.print(self._header_panel)
         self.console.print()
 
     def get_valid_filename(self) -> Optional[Tuple[str, str]]:
@@ -44,6 +70,8 @@ class CommandBuilder:
         Returns:
             Tuple[str, str]: Tuple of (filename, full_path) if valid, None if cancelled
         """
+        from ui import Confirm, Panel, Prompt
+
         self.console.print(Panel("File Configuration", border_style="blue"))
 
         while True:
@@ -81,18 +109,25 @@ class CommandBuilder:
         Returns:
             str: Valid command path or None if cancelled
         """
+        from ui import Panel, Prompt
+
         self.console.print(Panel("Path Configuration", border_style="blue"))
 
+        # Prompt panels are built once and reprinted on every retry
+        path_input_panel = Panel.fit(
+            "[info]Enter the full path for running commands.[/info]\n"
+            f"[dim]Current shell: [bold]{self.shell_type}[/bold][/dim]\n"
+            "[dim]Example: C:/Users/JohnDoe/project_name[/dim]",
+            title="Path Input",
+            border_style="cyan",
+        )
+        missing_path_panel = Panel.fit(
+            "1. Continue anyway\n2. Enter a different path",
+            border_style="yellow",
+        )
+
         while True:
-            self.console.print(
-                Panel.fit(
-                    "[info]Enter the full path for running commands.[/info]\n"
-                    f"[dim]Current shell: [bold]{self.shell_type}[/bold][/dim]\n"
-                    "[dim]Example: C:/Users/JohnDoe/project_name[/dim]",
-                    title="Path Input",
-                    border_style="cyan",
-                )
-            )
+            self.console.print(path_input_panel)
 
             command_path = Prompt.ask("[cyan]Path[/cyan]").strip()
 
@@ -106,12 +141,7 @@ class CommandBuilder:
                 self.console.print(
                     "[warning]Warning: The specified path does not exist.[/warning]"
                 )
-                self.console.print(
-                    Panel.fit(
-                        "1. Continue anyway\n2. Enter a different path",
-                        border_style="yellow",
-                    )
-                )
+                self.console.print(missing_path_panel)
                 choice = Prompt.ask(
                     "Choose an option",
                     choices=["1", "2"],
@@ -127,15 +157,11 @@ class CommandBuilder:
             self.console.print()
             return command_path
 
-    def collect_commands(self) -> Dict[str, str]:
-        """
-        Collect commands from user input.
+    @cached_property
+    def _command_guide_panel(self):
+        """Command input guide panel, built once and reused on every display."""
+        from ui import Padding, Panel, Text
 
-        Returns:
-            Dict[str, str]: Dictionary of collected commands
-        """
-        commands = {}
-        command_count = 0
         # Main instruction text
         main_text = Text.from_markup(
             "[bold cyan]Command Input Instructions[/bold cyan]\n\n"
@@ -162,26 +188,72 @@ class CommandBuilder:
 
         # Combine all sections with padding
         content = Padding(Text.assemble(main_text, examples, tips), (1, 2))
+        return Panel(
+            content,
+            title="[bold white]Command Input Guide[/bold white]",
+            subtitle="[italic]Type 'X' to finish[/italic]",
+            border_style="blue",
+            highlight=True,
+            padding=(1, 2),
+        )
+
+    def _read_bulk_commands(self) -> List[str]:
+        """
+        Read pasted commands, one per line, until an empty line, a lone 'X'
+        (as in interactive mode) or EOF.
+
+        Returns:
+            List[str]: Collected commands, in input order
+        """
         self.console.print(
-            Panel(
-                content,
-                title="[bold white]Command Input Guide[/bold white]",
-                subtitle="[italic]Type 'X' to finish[/italic]",
-                border_style="blue",
-                highlight=True,
-                padding=(1, 2),
-            )
+            "[info]Paste commands, one per line; empty line or 'X' to finish:[/info]"
         )
 
+        commands = []
+        try:
+            for line in iter(input, ""):
+                line = line.strip()
+                if line.upper() == "X":
+                    break
+                if line:
+                    commands.append(line)
+        except EOFError:
+            pass
+        return commands
+
+    def collect_commands(self) -> List[str]:
+        """
+        Collect commands from user input.
+
+        Returns:
+            List[str]: Collected commands, in input order
+        """
+        from ui import Confirm, Prompt, Text
+
+        commands = []
+        self.console.print(self._command_guide_panel)
+
+        if Confirm.ask(
+            "[info]Paste all commands at once?[/info]",
+            default=True,
+            console=self.console,
+        ):
+            commands = self._read_bulk_commands()
+            if commands or Confirm.ask(
+                "[warning]No commands have been added. Are you sure you want to save an empty command file?[/warning]",
+                console=self.console,
+            ):
+                return commands
+
         while True:
             command_prompt = Text()
-            command_prompt.append(f"\nCommand {command_count + 1}", style="bold cyan")
+            command_prompt.append(f"\nCommand {len(commands) + 1}", style="bold cyan")
             command_prompt.append(" (type 'X' to finish): ", style="dim")
 
             enter_command = Prompt.ask(command_prompt).strip()
 
             if enter_command.upper() == "X":
-                if command_count == 0:
+                if not commands:
                     if not Confirm.ask(
                         "[warning]No commands have been added. Are you sure you want to save an empty command file?[/warning]",
                         console=self.console,
@@ -195,13 +267,12 @@ class CommandBuilder:
                 )
                 continue
 
-            commands[f"command_{command_count}"] = enter_command
-            command_count += 1
+            commands.append(enter_command)
 
         return commands
 
     def save_commands(
-        self, full_path: str, command_path: str, commands: Dict[str, str]
+        self, full_path: str, command_path: str, commands: List[str]
     ) -> bool:
         """
         Save commands to JSON file.
@@ -209,13 +280,18 @@ class CommandBuilder:
         Args:
             full_path (str): Path to save the JSON file
             command_path (str): Path for running commands
-            commands (Dict[str, str]): Dictionary of commands to save
+            commands (List[str]): Commands to save, in run order
 
         Returns:
             bool: True if successful, False otherwise
         """
+        from ui import Panel
+
         try:
-            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            directory = os.path.dirname(full_path)
+            if directory not in self._existing_dirs:
+                os.makedirs(directory, exist_ok=True)
+                self._existing_dirs.add(directory)
 
             command_builder = {
                 "path": command_path,
@@ -223,8 +299,19 @@ class CommandBuilder:
                 "commands": commands,
             }
 
-            with open(full_path, "w") as json_file:
-                json.dump(command_builder, json_file, indent=4)
+            # Write to a temporary file and swap it in, so an interrupted save
+            # never leaves a truncated config behind
+            temp_path = full_path + ".tmp"
+            try:
+                with open(temp_path, "wb") as json_file:
+                    json_file.write(_dump_json(command_builder))
+                    json_file.flush()
+                    os.fsync(json_file.fileno())
+                os.replace(temp_path, full_path)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
 
             self.console.print(
                 Panel(
@@ -1,13 +1,41 @@
 import subprocess
 import shlex
 import platform
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from pathlib import Path, PureWindowsPath
 from typing import List, Tuple, Optional
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-from rich.table import Table
-from rich.theme import Theme
+
+
+def _format_powershell(command: str) -> List[str]:
+    """Return the argument list that runs a command in PowerShell."""
+    return ["powershell.exe", "-Command", command]
+
+
+def _format_bash(command: str) -> List[str]:
+    """Return the argument list that runs a command in bash."""
+    return ["/bin/bash", "-c", command]
+
+
+def _cd_prefix_powershell(path: str) -> str:
+    """Return the PowerShell snippet that changes into the given directory."""
+    return f'Set-Location "{PureWindowsPath(path)}"; '
+
+
+def _cd_prefix_bash(path: str) -> str:
+    """Return the bash snippet that changes into the given directory."""
+    # Relative paths are taken from the home directory
+    directory = Path(path).expanduser()
+    if not directory.is_absolute():
+        directory = Path.home() / directory
+    return f"cd {shlex.quote(str(directory))} && "
+
+
+# Shell type -> (command formatter, directory prefix builder)
+_SHELLS = {
+    "powershell": (_format_powershell, _cd_prefix_powershell),
+    "bash": (_format_bash, _cd_prefix_bash),
+}
 
 
 class CommandRunner:
@@ -25,6 +53,9 @@ class CommandRunner:
             path (str): Additional path information
             processes (List[subprocess.Popen]): List of running processes
             shell_type (str): Type of shell to use ('powershell' or 'bash')
+
+        Raises:
+            ValueError: If the shell type is not supported
         """
         self.directory = Path(directory)
         self.processes = processes or []
@@ -32,37 +63,77 @@ class CommandRunner:
         self.path = path
         self.shell_type = shell_type.lower()
 
+        # Bind the shell-specific helpers once instead of branching per command
+        if self.shell_type not in _SHELLS:
+            raise ValueError(
+                f"Unsupported shell type '{shell_type}'. Use 'powershell' or 'bash'."
+            )
+        self._format_command, self._cd_prefix = _SHELLS[self.shell_type]
+
         # Custom theme for consistent styling
-        custom_theme = Theme(
-            {
-                "info": "cyan",
-                "warning": "yellow",
-                "error": "red bold",
-                "success": "green bold",
-                "command": "blue",
-            }
-        )
-        self.console = Console(theme=custom_theme)
+        self._theme_dict = {
+            "info": "cyan",
+            "warning": "yellow",
+            "error": "red bold",
+            "success": "green bold",
+            "command": "blue",
+        }
+
+    @cached_property
+    def console(self):
+        """Rich console, built on first use so importing this module stays cheap."""
+        from ui import Console, Theme
+
+        return Console(theme=Theme(self._theme_dict))
+
+    def _spawn(self, command: str) -> subprocess.Popen:
+        """Start a command in the specified shell without reporting on it.
 
-    def _format_command(self, command: str) -> str:
-        """Format command based on shell type.
+        Used from the launch thread pool in `setup_servers`, which reports
+        the results itself so that they are printed in order.
 
         Args:
-            command (str): Command to format
+            command (str): Command to execute
 
         Returns:
-            str: Formatted command
+            subprocess.Popen: The started process. Its stdout is a pipe that the
+                caller must keep draining, otherwise the process blocks once
+                the pipe buffer fills up.
+
+        Raises:
+            Exception: Whatever `subprocess.Popen` raised if the process could
+                not be started.
         """
-        if self.shell_type == "powershell":
-            return f'powershell.exe -Command "{command}"'
-        elif self.shell_type == "bash":
-            return f"/bin/bash -c {shlex.quote(command)}"
-        else:
-            raise ValueError(
-                self.console.print(
-                    "[error]Unsupported shell type. Use 'powershell' or 'bash'.[/error]"
-                )
+        # The argument list is executed directly, without an extra /bin/sh
+        # or cmd.exe wrapper around the requested shell
+        return subprocess.Popen(
+            self._format_command(command),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            # Raw bytes with a large buffer; readers decode the output
+            # themselves, replacing anything undecodable
+            bufsize=65536,
+            text=False,
+            shell=False,
+            # Make each server a process group leader so that its whole
+            # tree can be signalled at once on shutdown (POSIX only)
+            start_new_session=True,
+            creationflags=(
+                subprocess.CREATE_NEW_CONSOLE if platform.system() == "Windows" else 0
+            ),
+        )
+
+    def _print_launch_error(self, error: Exception):
+        """Print the panel reported when a process fails to start."""
+        from ui import Panel, Text
+
+        self.console.print(
+            Panel(
+                Text(f"Failed to start process: {str(error)}", style="error"),
+                title="Error",
+                border_style="red",
             )
+        )
 
     def run_command(self, command: str) -> Optional[subprocess.Popen]:
         """Execute a command in the specified shell.
@@ -71,34 +142,17 @@ class CommandRunner:
             command (str): Command to execute
 
         Returns:
-            Optional[subprocess.Popen]: Process object if successful, None otherwise
+            Optional[subprocess.Popen]: Process object if successful, None otherwise.
+                Its stdout is a pipe that the caller must keep draining, otherwise
+                the process blocks once the pipe buffer fills up.
         """
-        formatted_command = self._format_command(command)
-
         self.console.print("[info]Executing command...[/info]")
         try:
-            process = subprocess.Popen(
-                formatted_command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                shell=True,
-                creationflags=(
-                    subprocess.CREATE_NEW_CONSOLE
-                    if platform.system() == "Windows"
-                    else 0
-                ),
-            )
+            process = self._spawn(command)
             self.console.print("[success]Command executed successfully[/success]")
             return process
         except Exception as e:
-            self.console.print(
-                Panel(
-                    Text(f"Failed to start process: {str(e)}", style="error"),
-                    title="Error",
-                    border_style="red",
-                )
-            )
+            self._print_launch_error(e)
             return None
 
     def setup_servers(
@@ -112,46 +166,50 @@ class CommandRunner:
         Returns:
             Tuple[Optional[List[subprocess.Popen]], Optional[List[str]]]: Tuple of processes and command names
         """
-        commands = []
-        path = Path(self.path)
+        from ui import Panel, Table, Text
+
+        command_prefix = self._cd_prefix(self.path)
+
+        self.console.print("[info]Starting servers...[/info]")
 
-        # Create table for command visualization
+        # Build, record and submit each command in a single pass; the launches
+        # overlap in a small thread pool while results are collected in order
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(commands_list)))) as ex:
+            rows = []
+            launches = []
+            for process_name, process in commands_list:
+                command = command_prefix + process
+                rows.append((process_name, command))
+
+                self.console.print(f"[info]Starting {process_name}...[/info]")
+                launches.append((process_name, ex.submit(self._spawn, command)))
+
+            # Workers only start the processes; every status line is printed
+            # here, in command order
+            for process_name, future in launches:
+                try:
+                    started = future.result()
+                except Exception as e:
+                    self._print_launch_error(e)
+                    started = None
+                if started is not None:
+                    self.command_names.append(process_name)
+                    self.processes.append(started)
+                    self.console.print(
+                        f"[success]Successfully started: {process_name}[/success]"
+                    )
+                else:
+                    self.console.print(
+                        f"[warning]Warning: [{process_name}] Failed to start.[/warning]"
+                    )
+
+        # Create table for command visualization in one go
         table = Table(title="Server Setup Commands")
         table.add_column("Process Name", style="cyan")
         table.add_column("Command", style="green")
-
-        if self.shell_type == "powershell":
-            path = str(path).replace("/", "\\")
-            for process_name, process in commands_list:
-                process = process.replace("/", "\\")
-                command = f'Set-Location "{path}"; {process}'
-                commands.append((process_name, command))
-                table.add_row(process_name, command)
-        elif self.shell_type == "bash":
-            for process_name, process in commands_list:
-                command = f"cd ~/{path} && {process}"
-                commands.append((process_name, command))
-                table.add_row(process_name, command)
-        else:
-            self.console.print(
-                "[error]Unsupported shell type. Use 'powershell' or 'bash'.[/error]"
-            )
-            return None, None
-
+        for row in rows:
+            table.add_row(*row)
         self.console.print(table)
-        self.console.print("[info]Starting servers...[/info]")
-
-        for name, cmd in commands:
-            self.console.print(f"[info]Starting {name}...[/info]")
-            process = self.run_command(cmd)
-            if process is not None:
-                self.command_names.append(name)
-                self.processes.append(process)
-                self.console.print(f"[success]Successfully started: {name}[/success]")
-            else:
-                self.console.print(
-                    f"[warning]Warning: [{name}] Failed to start.[/warning]"
-                )
 
         if not self.processes:
             self.console.print(
@@ -167,9 +225,12 @@ class CommandRunner:
         summary = Table(title="Server Setup Summary")
         summary.add_column("Status", style="cyan")
         summary.add_column("Count", style="green")
-        summary.add_row("Total Commands", str(len(commands)))
-        summary.add_row("Successfully Started", str(len(self.processes)))
-        summary.add_row("Failed", str(len(commands) - len(self.processes)))
+        for row in (
+            ("Total Commands", str(len(commands_list))),
+            ("Successfully Started", str(len(self.processes))),
+            ("Failed", str(len(commands_list) - len(self.processes))),
+        ):
+            summary.add_row(*row)
         self.console.print(summary)
 
         return self.processes, self.command_names
@@ -1,10 +1,114 @@
 import os
+import sys
 import json
-from typing import Dict, List
-import keyboard
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
+from contextlib import contextmanager
+from functools import cached_property, lru_cache
+from typing import Dict, List, Optional
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+    import select
+    import termios
+    import tty
+
+# Lines of the command panel that are not command rows (top and bottom
+# border, "… N more" markers above and below the visible rows)
+_COMMAND_PANEL_CHROME = 4
+
+# Arrow key escape sequences sent by POSIX terminals
+_ESCAPE_KEYS = {
+    "\x1b[A": "up",
+    "\x1b[B": "down",
+    "\x1b[C": "right",
+    "\x1b[D": "left",
+    "\x1bOA": "up",
+    "\x1bOB": "down",
+    "\x1bOC": "right",
+    "\x1bOD": "left",
+}
+
+# Longest sequence in _ESCAPE_KEYS
+_ESCAPE_KEY_LENGTH = 3
+
+# Second character of Windows console arrow key codes (after a 0x00/0xe0 prefix)
+_WINDOWS_KEYS = {"H": "up", "P": "down", "M": "right", "K": "left"}
+
+
+# Input read from the terminal but not yet returned by _getkey
+_pending_input = ""
+
+
+@contextmanager
+def _cbreak_mode():
+    """Put stdin in cbreak mode for the duration of the block (no-op on Windows)."""
+    if msvcrt is not None:
+        yield
+        return
+
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+
+def _getkey() -> str:
+    """
+    Block until a key is pressed and return its name.
+
+    Returns:
+        str: 'up', 'down', 'left' or 'right' for arrow keys, otherwise the
+            lowercased character that was typed
+    """
+    if msvcrt is not None:
+        key = msvcrt.getwch()
+        if key in ("\x00", "\xe0"):
+            return _WINDOWS_KEYS.get(msvcrt.getwch(), "")
+        return key.lower()
+
+    # One read can return several keys (e.g. while an arrow key is held), so
+    # the input is buffered and handed out one key or escape sequence per call
+    global _pending_input
+    fd = sys.stdin.fileno()
+    if not _pending_input:
+        _pending_input = os.read(fd, 64).decode(errors="ignore")
+
+    # On a slow terminal an escape sequence can also be split across reads
+    while (
+        len(_pending_input) < _ESCAPE_KEY_LENGTH
+        and _pending_input.startswith("\x1b")
+        and any(seq.startswith(_pending_input) for seq in _ESCAPE_KEYS)
+        and select.select([fd], [], [], 0.05)[0]
+    ):
+        _pending_input += os.read(fd, 64).decode(errors="ignore")
+
+    sequence = _pending_input[:_ESCAPE_KEY_LENGTH]
+    if sequence in _ESCAPE_KEYS:
+        _pending_input = _pending_input[_ESCAPE_KEY_LENGTH:]
+        return _ESCAPE_KEYS[sequence]
+
+    key, _pending_input = _pending_input[:1], _pending_input[1:]
+    return key.lower()
+
+
+@lru_cache(maxsize=128)
+def _load_json(file_path: str, mtime: float) -> Dict:
+    """
+    Parse a JSON file, memoized per path and modification time.
+
+    Args:
+        file_path (str): Path of the JSON file
+        mtime (float): Modification time of the file, only used as part of the cache key
+
+    Returns:
+        Dict: Parsed file contents
+    """
+    with open(file_path, "r") as f:
+        return json.load(f)
 
 
 class CommandViewer:
@@ -16,11 +120,23 @@ class CommandViewer:
             directory (str): Directory containing JSON command files
         """
         self.directory = directory
-        self.console = Console()
         self.current_file_index = 0
         self.current_command_index = 0
         self.files = []
         self.current_commands = {}
+        self._current_data: Optional[Dict] = None
+        self._commands: List[str] = []
+        self._row_selected: List = []
+        self._row_unselected: List = []
+        self._chrome_key: Optional[tuple] = None
+        self._chrome_height = 0
+
+    @cached_property
+    def console(self):
+        """Rich console, built on first use so importing this module stays cheap."""
+        from ui import Console
+
+        return Console()
 
     def load_command_files(self) -> List[str]:
         """
@@ -29,10 +145,21 @@ class CommandViewer:
         Returns:
             List[str]: List of JSON file names
         """
-        if not os.path.exists(self.directory):
-            raise FileNotFoundError(f"Directory {self.directory} does not exist")
-
-        self.files = [f for f in os.listdir(self.directory) if f.endswith(".json")]
+        try:
+            entries = os.scandir(self.directory)
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Directory {self.directory} does not exist"
+            ) from None
+
+        # Files are only stat'ed when opened, so one that is unreadable or
+        # removed after the scan does not affect listing the others
+        with entries:
+            self.files = [
+                entry.name for entry in entries if entry.name.endswith(".json")
+            ]
+        _load_json.cache_clear()
+        self._current_data = None
         return self.files
 
     def load_commands_from_file(self, filename: str) -> Dict:
@@ -46,37 +173,106 @@ class CommandViewer:
             Dict: Dictionary containing the commands
         """
         file_path = os.path.join(self.directory, filename)
-        with open(file_path, "r") as f:
-            return json.load(f)
+        data = _load_json(file_path, os.stat(file_path).st_mtime)
+
+        # Older files store commands as a {"command_<n>": command} mapping
+        commands = data.get("commands", [])
+        if isinstance(commands, dict):
+            data = {**data, "commands": list(commands.values())}
+        return data
+
+    def _get_current_data(self) -> Dict:
+        """Return the data of the current file, reusing the last displayed one."""
+        if self._current_data is None:
+            self._current_data = self.load_commands_from_file(
+                self.files[self.current_file_index]
+            )
+            self._commands = self._current_data.get("commands", [])
+            self._row_selected = []
+            self._row_unselected = []
+        return self._current_data
+
+    def _build_rows(self):
+        """Pre-render the selected and unselected markup of every command row."""
+        from ui import escape
+
+        escaped = [escape(command) for command in self._commands]
+        self._row_selected = [
+            f"[bold green]> command_{idx}: {command}[/]\n"
+            for idx, command in enumerate(escaped)
+        ]
+        self._row_unselected = [
+            f"[dim]  command_{idx}: {command}[/]\n"
+            for idx, command in enumerate(escaped)
+        ]
+
+    @cached_property
+    def _navigation_help(self):
+        """Navigation help shown below the command panel."""
+        from ui import Text
+
+        return Text.from_markup(
+            "\n[dim]Navigation:[/dim]\n"
+            "[dim]↑/↓: Navigate commands | ←/→: Navigate files | Q: Quit | R: Run Command [/dim] | [yellow] L: Run All Commands [/yellow]"
+        )
+
+    def _measure_chrome(self, parts: List) -> int:
+        """
+        Return the number of terminal lines taken by everything except the
+        command rows, at the current console width.
+
+        The result is cached per file and width, since the header and
+        configuration panel only change with the file.
+
+        Args:
+            parts (List): Header renderables shown above the command panel
+        """
+        from ui import Group
+
+        options = self.console.options
+        key = (self.current_file_index, id(self._current_data), options.max_width)
+        if key != self._chrome_key:
+            chrome = Group(*parts, self._navigation_help)
+            self._chrome_height = (
+                len(self.console.render_lines(chrome, options, pad=False))
+                + _COMMAND_PANEL_CHROME
+            )
+            self._chrome_key = key
+        return self._chrome_height
 
     def clear_screen(self):
         """Clear the terminal screen."""
         self.console.clear()
 
     def display_current_view(self):
-        """Display the current command view with navigation information."""
-        self.clear_screen()
+        """
+        Build the current command view with navigation information.
+
+        Returns:
+            Group: Renderable for the whole screen, drawn by the Live display in run()
+        """
+        from ui import Group, Panel, Text
 
         if not self.files:
-            self.console.print("[red]No command files found in directory[/red]")
-            return
+            return Text.from_markup("[red]No command files found in directory[/red]")
 
-        # Display current file info
+        # Current file info
         current_file = self.files[self.current_file_index]
-        self.console.print(
-            f"\n[bold blue]File ({self.current_file_index + 1}/{len(self.files)}): "
-            f"{current_file}[/bold blue]\n"
-        )
+        parts = [
+            Text.from_markup(
+                f"\n[bold blue]File ({self.current_file_index + 1}/{len(self.files)}): "
+                f"{current_file}[/bold blue]\n"
+            )
+        ]
 
         try:
-            # Load and display commands from current file
-            command_data = self.load_commands_from_file(current_file)
-            commands = command_data.get("commands", {})
+            # Load commands from current file
+            command_data = self._get_current_data()
             path = command_data.get("path", "N/A")
             shell_type = command_data.get("shell_type", "N/A")
 
-            # Display file metadata
-            self.console.print(
+            # File metadata
+            parts.append(
                 Panel(
                     f"Path: {path}\nShell Type: {shell_type}",
                     title="Configuration",
@@ -84,48 +280,65 @@ class CommandViewer:
                 )
             )
 
-            # Display commands
-            if not commands:
-                self.console.print("\n[yellow]No commands found in this file[/yellow]")
-                return
-
-            command_items = list(commands.items())
-            current_command = command_items[self.current_command_index]
-
-            # Create command display
-            command_text = Text()
-            for idx, (cmd_key, cmd_value) in enumerate(command_items):
-                if idx == self.current_command_index:
-                    command_text.append(
-                        f"> {cmd_key}: {cmd_value}\n", style="bold green"
+            # Commands
+            if not self._commands:
+                parts.append(
+                    Text.from_markup(
+                        "\n[yellow]No commands found in this file[/yellow]"
                     )
-                else:
-                    command_text.append(f"  {cmd_key}: {cmd_value}\n", style="dim")
+                )
+                return Group(*parts)
 
-            self.console.print(
+            if not self._row_selected:
+                self._build_rows()
+
+            # Only render the rows that fit in the terminal, centred on the cursor
+            total = len(self._commands)
+            visible = max(1, self.console.size.height - self._measure_chrome(parts))
+            start = max(
+                0, min(self.current_command_index - visible // 2, total - visible)
+            )
+            end = min(total, start + visible)
+
+            # Create command display from the pre-rendered rows in a single parse
+            rows = self._row_unselected[start:end]
+            rows[self.current_command_index - start] = self._row_selected[
+                self.current_command_index
+            ]
+            if start > 0:
+                rows.insert(0, f"[dim]  … {start} more[/]\n")
+            if end < total:
+                rows.append(f"[dim]  … {total - end} more[/]\n")
+            # Long commands are cut off rather than wrapped, so that every row
+            # takes exactly one line of the height worked out above; the last
+            # row's newline is dropped so it does not add a blank line
+            command_text = Text.from_markup("".join(rows)[:-1], overflow="ellipsis")
+            command_text.no_wrap = True
+
+            parts.append(
                 Panel(
                     command_text,
-                    title=f"Commands ({self.current_command_index + 1}/{len(commands)})",
+                    title=f"Commands ({self.current_command_index + 1}/{total})",
                     border_style="green",
                 )
             )
 
-            # Display navigation help
-            self.console.print("\n[dim]Navigation:[/dim]")
-            self.console.print(
-                "[dim]↑/↓: Navigate commands | ←/→: Navigate files | Q: Quit | R: Run Command [/dim] | [yellow] L: Run All Commands [/yellow]"
-            )
+            # Navigation help
+            parts.append(self._navigation_help)
 
         except Exception as e:
-            self.console.print(f"[red]Error loading commands: {str(e)}[/red]")
+            parts.append(
+                Text.from_markup(f"[red]Error loading commands: {str(e)}[/red]")
+            )
+
+        return Group(*parts)
 
     def _navigate_commands(self, direction):
         """Navigate between commands in the current file."""
-        command_data = self.load_commands_from_file(self.files[self.current_file_index])
-        commands = command_data.get("commands", {})
-        if commands:
+        self._get_current_data()
+        if self._commands:
             self.current_command_index = (self.current_command_index + direction) % len(
-                commands
+                self._commands
             )
 
     def _navigate_files(self, direction):
@@ -134,14 +347,18 @@ class CommandViewer:
             self.files
         )
         self.current_command_index = 0
+        self._current_data = None
 
     def _handle_list_command(self):
         """Handle 'L' key press - return all commands with metadata.
         Returns dict with commands list and metadata
         """
-        command_data = self.load_commands_from_file(self.files[self.current_file_index])
+        command_data = self._get_current_data()
         return {
-            "commands": list(command_data.get("commands", {}).items()),
+            "commands": [
+                (f"command_{idx}", command)
+                for idx, command in enumerate(self._commands)
+            ],
             "path": command_data.get("path"),
             "shell_type": command_data.get("shell_type"),
         }
@@ -151,11 +368,12 @@ class CommandViewer:
         Handle 'R' key press - return current command with metadata.
         Returns dict with single command and metadata.
         """
-        command_data = self.load_commands_from_file(self.files[self.current_file_index])
-        commands = command_data.get("commands", {})
-        command_items = list(commands.items())
+        command_data = self._get_current_data()
         return {
-            "command": command_items[self.current_command_index],
+            "command": (
+                f"command_{self.current_command_index}",
+                self._commands[self.current_command_index],
+            ),
             "path": command_data.get("path"),
             "shell_type": command_data.get("shell_type"),
         }
@@ -170,6 +388,8 @@ class CommandViewer:
                 - Tuple of current command when 'R' is pressed
                 - None when viewer is closed or error occurs
         """
+        from ui import Live
+
         try:
 
             if not (self.load_command_files()):
@@ -177,8 +397,6 @@ class CommandViewer:
                 self.console.print("[red]No command files found[/red]")
                 return None
 
-            self.display_current_view()
-
             # Key mapping for better readability and maintenance
             KEY_ACTIONS = {
                 "q": lambda: "quit",
@@ -190,22 +408,25 @@ class CommandViewer:
                 "right": lambda: self._navigate_files(1),
             }
 
-            while True:
-                event = keyboard.read_event(suppress=True)
-                if event.event_type != "down":
-                    continue
-
-                action = KEY_ACTIONS.get(event.name.lower())
-                if not action:
-                    continue
-
-                result = action()
-                if result == "quit":
-                    break
-                if result is not None:
-                    return result
-
-                self.display_current_view()
+            # Live redraws the view in place instead of clearing the screen per key
+            with _cbreak_mode(), Live(
+                self.display_current_view(),
+                console=self.console,
+                screen=True,
+                auto_refresh=False,
+            ) as live:
+                while True:
+                    action = KEY_ACTIONS.get(_getkey())
+                    if not action:
+                        continue
+
+                    result = action()
+                    if result == "quit":
+                        break
+                    if result is not None:
+                        return result
+
+                    live.update(self.display_current_view(), refresh=True)
 
         except KeyboardInterrupt:
             self.console.print("\n[yellow]Viewer closed[/yellow]")
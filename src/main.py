@@ -1,170 +1,470 @@
+import os
+import platform
+import selectors
+import signal
 import subprocess
 import threading
 import time
-import psutil
-import argparse
+import contextlib
 from command_builder import CommandBuilder
-from command_viewer import CommandViewer
-from command_runner import CommandRunner
 import sys
-from rich.console import Console
-from rich.live import Live
-from typing import List, Optional, Dict, Tuple
-from rich.table import Table
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional, Dict, Tuple
 
+if TYPE_CHECKING:
+    import psutil
+    from ui import Table
 
-def read_output(process, name):
+
+@lru_cache(maxsize=None)
+def get_console():
+    """
+    Returns the console shared by every function in this module.
+
+    Creating a Console probes the terminal and environment, so it is done
+    once on first use rather than on every call (e.g. per terminated process).
+    """
+    from ui import Console
+
+    return Console()
+
+
+# Servers lead their own process group on POSIX (see CommandRunner._spawn)
+USE_PROCESS_GROUPS = hasattr(os, "killpg")
+
+# Bytes requested per read from a process pipe
+READ_SIZE = 1 << 16
+
+# Largest partial line kept per pipe before it is printed without a newline
+MAX_BUFFER_SIZE = 1 << 20
+
+
+@dataclass(slots=True)
+class ProcState:
+    """
+    A launched server and what the monitor knows about it.
+
+    Attributes:
+        popen: The server process
+        name: Label used in output and the status table
+        pidfd: Exit notification descriptor, or -1 when not watched
+        status: Return code from the last poll (None while running)
+    """
+
+    popen: subprocess.Popen
+    name: str
+    pidfd: int = -1
+    status: Optional[int] = None
+
+
+def split_lines(pending: bytes, chunk: bytes) -> Tuple[List[bytes], bytes]:
+    """
+    Splits a chunk of raw output into complete lines.
+
+    Args:
+        pending (bytes): Partial line left over from the previous chunk.
+        chunk (bytes): Newly read bytes.
+
+    Returns:
+        Tuple[List[bytes], bytes]: The complete lines (without newlines) and
+            the new partial line. A partial line longer than MAX_BUFFER_SIZE is
+            returned as a line of its own.
+    """
+    *lines, rest = (pending + chunk).split(b"\n")
+    if len(rest) > MAX_BUFFER_SIZE:
+        lines.append(rest)
+        rest = b""
+    return lines, rest
+
+
+def write_lines(prefix: str, lines: List[bytes]):
+    """
+    Writes a batch of output lines to stdout, each labelled with a prefix.
+
+    All lines go out in a single write. They are written to `sys.stdout`
+    rather than its byte buffer because, while the status table is shown,
+    Rich's Live swaps stdout for a proxy that prints above the table.
+
+    Args:
+        prefix (str): Label prepended to every line, e.g. "[name] "
+        lines (List[bytes]): Raw lines without their newlines
+    """
+    sys.stdout.write(
+        "".join(f"{prefix}{line.decode(errors='replace').strip()}\n" for line in lines)
+    )
+
+
+def read_output(process, name, state_changed=None):
     """
     Streams the output of a given process line-by-line and labels it with a specified name.
 
+    Only used where pipes cannot be registered with a selector (Windows);
+    elsewhere `stream_output` serves every process from a single thread.
+
     Args:
         process (subprocess.Popen): The process from which to read output.
         name (str): A label or identifier for the process, used in output.
+        state_changed (threading.Event, optional): Set once the output ends,
+            which usually means the process is exiting.
     """
     if process is None:
         print(f"[{name}] Process not started.")
         return
     try:
-        for line in process.stdout:
-            if line:
-                print(f"[{name}] {line.strip()}")
-            else:
+        # Read in large chunks and split lines here rather than iterating
+        # the pipe line by line
+        fd = process.stdout.fileno()
+        prefix = f"[{name}] "
+        pending = b""
+        while True:
+            chunk = os.read(fd, READ_SIZE)
+            if not chunk:
                 break
+            lines, pending = split_lines(pending, chunk)
+            if lines:
+                write_lines(prefix, lines)
+        if pending:
+            write_lines(prefix, [pending])
     except Exception as e:
         print(f"[{name}] Error reading output: {e}")
     finally:
-        if process.stdout:
-            process.stdout.close()
+        if state_changed is not None:
+            state_changed.set()
 
 
-def kill_process_tree(pid):
+def stream_output(
+    procs: List[ProcState], state_changed: threading.Event
+) -> threading.Thread:
     """
-    Terminates a process and all of its child processes.
+    Streams the output of all processes from one thread, labelling each line
+    with the name of the process that produced it.
+
+    The same thread also watches the pidfds opened by `watch_process_exits`,
+    so that it can tell the monitor loop when a server exits.
 
     Args:
-        pid (int): The process ID of the parent process to terminate.
+        procs: The running servers
+        state_changed: Set whenever a pipe reaches EOF or a server exits
 
-    The function first attempts to terminate all child processes recursively,
-    then the parent process itself. If any processes remain alive after the
-    initial termination attempt, it forcefully kills them. Handles exceptions
-    for non-existent, inaccessible, or zombie processes to ensure robust
-    termination.
+    Returns:
+        The started daemon thread
     """
+    selector = selectors.DefaultSelector()
+    for st in procs:
+        os.set_blocking(st.popen.stdout.fileno(), False)
+        selector.register(st.popen.stdout, selectors.EVENT_READ, data=f"[{st.name}] ")
+        if st.pidfd != -1:
+            selector.register(st.pidfd, selectors.EVENT_READ, data=st)
 
-    try:
-        parent = psutil.Process(pid)
-        children = parent.children(recursive=True)
+    thread = threading.Thread(
+        target=_pump_output, args=(selector, state_changed), daemon=True
+    )
+    thread.start()
+    return thread
 
-        # Terminate child processes
-        for child in children:
+
+def _pump_output(selector: selectors.BaseSelector, state_changed: threading.Event):
+    """
+    Read every ready pipe registered on the selector until all of them reach EOF.
+
+    Args:
+        selector: Selector with process stdout pipes registered with their
+            output prefix as data, and pidfds with their ProcState as data
+        state_changed: Set when a pipe reaches EOF or a pidfd becomes ready
+    """
+    pending: Dict[int, bytes] = {}  # Partial last line per pipe
+    while selector.get_map():
+        for key, _ in selector.select(timeout=0.5):
+            if isinstance(key.data, ProcState):
+                # The server exited; the pidfd itself stays open on the exit
+                # selector until shutdown
+                selector.unregister(key.fd)
+                state_changed.set()
+                continue
+
+            prefix = key.data
             try:
-                child.terminate()
-            except (
-                psutil.NoSuchProcess,
-                psutil.AccessDenied,
-                psutil.ZombieProcess,
-            ) as e:
-                print(f"Error terminating child process {child.pid}: {e}")
+                chunk = os.read(key.fd, READ_SIZE)
+            except BlockingIOError:
+                continue
+            except OSError:
+                chunk = b""  # Pipe was closed during shutdown
+
+            if not chunk:
+                leftover = pending.pop(key.fd, b"")
+                if leftover:
+                    write_lines(prefix, [leftover])
+                selector.unregister(key.fileobj)
+                state_changed.set()
+                continue
+
+            lines, pending[key.fd] = split_lines(pending.get(key.fd, b""), chunk)
+            if lines:
+                write_lines(prefix, lines)
+    selector.close()
+
+
+def signal_process_tree(process: "psutil.Process", force: bool = False):
+    """
+    Terminates (or kills, if `force` is set) a server and its descendants.
 
-        # Terminate parent process
-        try:
-            parent.terminate()
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess) as e:
-            print(f"Error terminating parent process {parent.pid}: {e}")
+    Servers are started as process group leaders on POSIX, so a single
+    `os.killpg` signals the whole tree without enumerating it. Elsewhere only
+    the given process is signalled; callers walk the tree themselves.
 
-        # Wait for processes to terminate
+    Args:
+        process (psutil.Process): The server process to signal.
+        force (bool): Send SIGKILL instead of SIGTERM.
+    """
+    if USE_PROCESS_GROUPS:
         try:
-            alive_processes = [
-                p for p in children + [parent] if psutil.pid_exists(p.pid)
-            ]
-            gone, alive = psutil.wait_procs(alive_processes, timeout=3)
-            for p in alive:
-                try:
-                    p.kill()
-                except (
-                    psutil.NoSuchProcess,
-                    psutil.AccessDenied,
-                    psutil.ZombieProcess,
-                ) as e:
-                    print(f"Error killing process {p.pid}: {e}")
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess) as e:
-            print(f"Error waiting for processes to terminate: {e}")
-    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess) as e:
-        print(f"Error accessing process {pid}: {e}")
+            # The group id of a session leader is its pid, and it stays valid
+            # for the remaining members even after the leader itself has exited
+            os.killpg(process.pid, signal.SIGKILL if force else signal.SIGTERM)
+        except ProcessLookupError:
+            pass  # The whole group is already gone
+    elif force:
+        process.kill()
+    else:
+        process.terminate()
 
 
-def handle_process_termination(pid, return_code):
+def process_group_exists(pgid: int) -> bool:
     """
-    Handles return code on termination of a process
+    Checks whether a process group still has any members.
+
+    Args:
+        pgid (int): The process group id, i.e. the pid of the server that leads it.
+
+    Returns:
+        bool: True while at least one process in the group is alive
+    """
+    try:
+        os.killpg(pgid, 0)  # Signal 0 only checks for existence
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # A member exists but belongs to another user
+    return True
+
+
+def wait_for_process_groups(pgids, timeout: float) -> List[int]:
+    """
+    Waits for every member of the given process groups to exit.
+
+    Nothing reports when the last member of a group exits, so the groups are
+    checked with `process_group_exists` on a short interval.
+
+    Args:
+        pgids (Iterable[int]): The process group ids to wait for.
+        timeout (float): Maximum number of seconds to wait.
+
+    Returns:
+        List[int]: The groups that still had members when the timeout elapsed
+    """
+    deadline = time.monotonic() + timeout
+    alive = list(pgids)
+    while True:
+        alive = [pgid for pgid in alive if process_group_exists(pgid)]
+        if not alive or time.monotonic() >= deadline:
+            return alive
+        time.sleep(0.1)
+
+
+def termination_message(pid, return_code) -> str:
+    """
+    Describes the return code of a terminated process.
 
     Args:
         pid (int): the id of a process
         return_code (int): The code of a terminated process.
-    """
-    console = Console()
 
+    Returns:
+        str: Console markup reporting how the process ended
+    """
     if return_code == 0:
-        console.print(f"[green]Process {pid} terminated normally[/green]")
+        return f"[green]Process {pid} terminated normally[/green]"
     elif return_code < 0:
-        console.print(f"[red]Process {pid} terminated by signal -{return_code}[/red]")
+        return f"[red]Process {pid} terminated by signal -{return_code}[/red]"
     else:
-        console.print(
-            f"[yellow]Process {pid} terminated with non-zero code {return_code} - possible error[/yellow]"
-        )
+        return f"[yellow]Process {pid} terminated with non-zero code {return_code} - possible error[/yellow]"
 
 
-def kill_servers(processes):
+def handle_process_termination(pid, return_code):
+    """
+    Handles return code on termination of a process
+
+    Args:
+        pid (int): the id of a process
+        return_code (int): The code of a terminated process.
+    """
+    get_console().print(termination_message(pid, return_code))
+
+
+def reap_exits(
+    selector: selectors.BaseSelector, timeout: float, callback=None
+) -> List[ProcState]:
+    """
+    Reap the processes watched by the selector as they exit.
+
+    Each exit is collected with a blocking `os.waitid` on the process's pidfd,
+    which returns the exact status without polling. The pidfd is closed and
+    the return code is stored on the Popen object, as `Popen.wait` would.
+
+    Args:
+        selector: Selector returned by `watch_process_exits`
+        timeout: Maximum number of seconds to wait for all of them
+        callback: Called with each reaped Popen, like `psutil.wait_procs`'s
+            callback; defaults to `handle_process_termination`
+
+    Returns:
+        The servers that were still running when the timeout elapsed; their
+        pidfds stay registered on the selector
+    """
+    deadline = time.monotonic() + timeout
+    while selector.get_map():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        for key, _ in selector.select(timeout=remaining):
+            st = key.data
+            process = st.popen
+            selector.unregister(key.fd)
+            try:
+                info = os.waitid(os.P_PIDFD, key.fd, os.WEXITED)
+            except ChildProcessError:
+                info = None  # Already reaped elsewhere
+            finally:
+                os.close(key.fd)
+                st.pidfd = -1
+            if info is not None:
+                if info.si_code in (os.CLD_KILLED, os.CLD_DUMPED):
+                    process.returncode = -info.si_status
+                else:
+                    process.returncode = info.si_status
+            st.status = process.returncode
+            if callback is not None:
+                callback(process)
+            else:
+                handle_process_termination(process.pid, process.returncode)
+    return [key.data for key in selector.get_map().values()]
+
+
+def kill_servers(procs, exit_selector=None):
     """
     Terminates a list of server processes and their child processes.
 
     Args:
-        processes (list): A list of subprocess.Popen objects representing the
-                          server processes to be terminated.
-
-    For each active process in the list, this function:
-    - Terminates the entire process tree, including child processes, by calling
-      `kill_process_tree`.
-    - Closes any open `stdout` file descriptors for cleanup.
-    - Waits for the process to terminate, with a timeout to prevent hanging.
-
-    If a process does not terminate within the timeout, it attempts a forced
-    kill. Logs any errors encountered during cleanup and ensures all processes
-    are terminated before exiting.
-    """
-    console = Console()
-    if processes:
-        for process in processes:
+        procs (list): A list of ProcState objects for the servers to be
+                          terminated.
+        exit_selector (selectors.BaseSelector, optional): Selector returned by
+                          `watch_process_exits`. Servers with a pidfd on it are
+                          reaped through `reap_exits`.
+
+    Shutdown happens in two passes so that it takes as long as the slowest
+    process rather than the sum of all of them:
+    - Every active process and its descendants are sent a terminate signal,
+      without waiting in between. On POSIX this is one signal per process
+      group; elsewhere the descendants are collected individually.
+    - A single wait covers all of them at once; any that are still alive
+      after the timeout are force killed. Servers with a pidfd are waited on
+      through it, the rest with `psutil.wait_procs`. On POSIX every process
+      group that still has members is killed, even if its leader has exited.
+
+    The `stdout` pipes are left open; `main` closes them. Logs any errors
+    encountered during cleanup; messages are collected and printed once per
+    pass rather than one write per process.
+    """
+    import psutil
+    from ui import Group
+
+    console = get_console()
+    lines = []
+    if procs:
+        server_pids = set()
+        victims = []  # Waited on with psutil
+        watched_victims = []  # Waited on through their pidfds
+        for st in procs:
+            process = st.popen
             if not isinstance(process, subprocess.Popen):
                 raise TypeError(
                     f"Excepted subprocess.Popen object, got {type(process)}"
                 )
 
-            if (
-                process is not None and process.poll() is None
-            ):  # Process is still running
+            if process.poll() is None:  # Process is still running
+                lines.append(f"\n[red] Killing process {process.pid}")
                 try:
-                    console.print(f"\n[red] Killing process {process.pid}")
-                    kill_process_tree(process.pid)
-                    # Clean up file descriptors
-                    if process.stdout:
-                        process.stdout.close()
-
-                    return_code = process.wait(timeout=5)  # Wait for process to finish
-                    handle_process_termination(process.pid, return_code)
+                    parent = psutil.Process(process.pid)
+                    if st.pidfd != -1:
+                        watched_victims.append(parent)
+                    else:
+                        if not USE_PROCESS_GROUPS:
+                            victims.extend(parent.children(recursive=True))
+                        victims.append(parent)
+                    server_pids.add(process.pid)
+                except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
+                    lines.append(f"[red]Error during cleanup: {e} [/red]")
+
+        def on_terminate(proc):
+            # Only the servers themselves are reported, not their descendants
+            if proc.pid in server_pids:
+                lines.append(termination_message(proc.pid, proc.returncode))
+
+        # Pass 1: signal every process (or process group) without waiting
+        for victim in watched_victims + victims:
+            try:
+                signal_process_tree(victim)
+            except (
+                psutil.NoSuchProcess,
+                psutil.AccessDenied,
+                psutil.ZombieProcess,
+                PermissionError,
+            ) as e:
+                lines.append(f"[red]Error terminating process {victim.pid}: {e}")
+        console.print(Group(*lines))
+        lines.clear()
+
+        # Pass 2: one wait for all of them, then force kill the stragglers
+        deadline = time.monotonic() + 5
+        stragglers = []
+        if exit_selector is not None:
+            stragglers = reap_exits(exit_selector, timeout=5, callback=on_terminate)
+        _, alive = psutil.wait_procs(
+            victims,
+            timeout=max(0, deadline - time.monotonic()),
+            callback=on_terminate,
+        )
+        if USE_PROCESS_GROUPS:
+            # A leader that exits on SIGTERM (e.g. a `bash -c` wrapper) can
+            # leave descendants behind that ignore it, so every group is
+            # killed while it still has members, not just when its leader does
+            for pgid in wait_for_process_groups(
+                server_pids, timeout=max(0, deadline - time.monotonic())
+            ):
+                try:
+                    os.killpg(pgid, signal.SIGKILL)
+                except (ProcessLookupError, PermissionError) as e:
+                    lines.append(f"[red]Failed to kill process: {e} [/red]")
+        else:
+            for victim in alive:
+                try:
+                    signal_process_tree(victim, force=True)
                 except (
                     psutil.NoSuchProcess,
-                    subprocess.TimeoutExpired,
                     psutil.AccessDenied,
+                    psutil.ZombieProcess,
+                    PermissionError,
                 ) as e:
-                    console.print(f"[red]Error during cleanup: {e} [/red]")
-                    try:
-                        process.kill()  # Force kill if necessary
-                        process.wait()
-                    except Exception as e:
-                        console.print(f"[red]Failed to kill process: {e} [/red]")
+                    lines.append(f"[red]Failed to kill process: {e} [/red]")
+        if stragglers:
+            reap_exits(exit_selector, timeout=2, callback=on_terminate)
+        if alive:
+            psutil.wait_procs(alive, timeout=2, callback=on_terminate)
     else:
-        console.print("[yellow] no processes to terminate [/yellow]")
-    console.print("[yellow]Servers have been terminated.[/yellow]")
+        lines.append("[yellow] no processes to terminate [/yellow]")
+    lines.append("[yellow]Servers have been terminated.[/yellow]")
+    console.print(Group(*lines))
 
 
 def create_new_command() -> bool:
@@ -211,6 +511,8 @@ def execute_commands():
                       'path', 'shell_type', and 'commands' (or similar).
                       Returns None if no command is selected or an error occurs.
     """
+    from command_viewer import CommandViewer
+
     try:
         viewer = CommandViewer()
         selected_command = viewer.run()
@@ -234,29 +536,75 @@ def execute_commands():
         return None
 
 
-def create_process_status_table(
-    processes: List[subprocess.Popen], process_names: List[str]
-) -> Table:
+def watch_process_exits(procs: List[ProcState]) -> Optional[selectors.BaseSelector]:
+    """
+    Register a pidfd for each process so that exits can be waited on by the kernel.
+
+    Args:
+        procs: The running servers; each watched one has its `pidfd` set
+
+    Returns:
+        A selector with one pidfd per process (the ProcState as its data),
+        or None when pidfds are unsupported (non-Linux or kernel < 5.3)
+    """
+    if not hasattr(os, "pidfd_open"):
+        return None
+
+    selector = selectors.DefaultSelector()
+    for st in procs:
+        try:
+            pidfd = os.pidfd_open(st.popen.pid)
+        except ProcessLookupError:
+            continue  # Already exited and reaped; poll() reports it
+        except OSError:
+            close_process_watch(selector)
+            return None
+        selector.register(pidfd, selectors.EVENT_READ, st)
+        st.pidfd = pidfd
+    return selector
+
+
+def close_process_watch(selector: selectors.BaseSelector):
+    """
+    Close every pidfd still registered on the selector, then the selector itself.
+
+    Args:
+        selector: Selector returned by `watch_process_exits`
+    """
+    for key in list(selector.get_map().values()):
+        selector.unregister(key.fd)
+        os.close(key.fd)
+        key.data.pidfd = -1
+    selector.close()
+
+
+def create_process_status_table(procs: List[ProcState]) -> "Table":
     """
     Create a status table for running processes.
 
+    A new Table is built on every call rather than refilling a shared one:
+    Live may be rendering the previous table from another thread (output
+    written to the redirected stdout triggers a redraw), and the table is
+    only rebuilt when a process changes state.
+
     Args:
-        processes: List of running processes
-        process_names: List of process names
+        procs: The servers, with `status` set by this tick's `poll()`
 
     Returns:
         Rich Table object showing process status
     """
+    from ui import Table
+
     table = Table(title="Process Status")
     table.add_column("Process Name", style="cyan")
     table.add_column("Status", style="green")
     table.add_column("PID", style="blue")
 
-    for process, name in zip(processes, process_names):
-        status = "Running" if process.poll() is None else "Terminated"
+    for st in procs:
+        status = "Running" if st.status is None else "Terminated"
         status_style = "green" if status == "Running" else "red"
         table.add_row(
-            name, f"[{status_style}]{status}[/{status_style}]", str(process.pid)
+            st.name, f"[{status_style}]{status}[/{status_style}]", str(st.popen.pid)
         )
 
     return table
@@ -285,11 +633,21 @@ def main():
         RuntimeError: If command creation or execution encounters an issue.
     """
 
-    processes = []
-    console = Console()
+    # Plain `-c` only runs the command builder, so skip the argument parser
+    # and the server-side imports (psutil, the viewer and the runner)
+    if sys.argv[1:] in (["-c"], ["--create"]):
+        create_new_command()
+        return
+
+    procs = []
+    exit_selector = None
+    pipes = contextlib.ExitStack()  # Owns every server's stdout pipe
+    console = get_console()
     try:
 
         # Argument parsing setup
+        import argparse
+
         parser = argparse.ArgumentParser(
             description="Command Builder Application",
             formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -335,19 +693,15 @@ def main():
         if args.create:
             try:
                 create_new_command()
-                if not args.execute:
-                    sys.exit(
-                        0
-                    )  # Exit after creating a command list if not executing as well
             except Exception as e:
                 console.print(f"\n[red] An error occured {e} [/red]")
                 sys.exit(1)
+            if not args.execute:
+                return  # Exit after creating a command list if not executing as well
 
-        # Handle command execution
-        if args.start_server or (args.create and args.execute):
-            command_link = execute_commands()
-
-        if not command_link or command_link == None:
+        # Handle command execution; only -s and -c -e get this far
+        command_link = execute_commands()
+        if command_link is None:
             console.print(f"\n[red] No commands selected for execution. [/red]")
             sys.exit()
 
@@ -363,54 +717,92 @@ def main():
             sys.exit(1)
 
         # Initialize CommandRunner and set up servers
-        process_runner = CommandRunner(path=path, shell_type=shell_type)
+        from command_runner import CommandRunner
+
+        try:
+            process_runner = CommandRunner(path=path, shell_type=shell_type)
+        except ValueError as e:
+            console.print(f"\n[red] {e} [/red]")
+            sys.exit(1)
         processes, process_names = process_runner.setup_servers(commands_list)
         if not processes:
             console.print("\n [red] Failed to start any servers. Exiting. [/red]")
             sys.exit(1)
-            # Start threads to read output from each process
-        threads = []
-        for process, name in zip(processes, process_names):
-            t = threading.Thread(target=read_output, args=(process, name), daemon=True)
-            t.start()
-            threads.append(t)
+        procs = [ProcState(p, n) for p, n in zip(processes, process_names)]
+        for st in procs:
+            pipes.callback(st.popen.stdout.close)
+
+        # Wake up as soon as a server exits instead of polling on a timer
+        exit_selector = watch_process_exits(procs)
+        state_changed = threading.Event()
+
+        # Stream output from every process; pipes can only be multiplexed
+        # with a selector on POSIX, so Windows keeps a reader thread per process
+        if platform.system() == "Windows":
+            for st in procs:
+                threading.Thread(
+                    target=read_output,
+                    args=(st.popen, st.name, state_changed),
+                    daemon=True,
+                ).start()
+        else:
+            stream_output(procs, state_changed)
 
         console.print("\n[info]Press Ctrl+C to stop all servers[/info]\n")
 
         # Main loop to monitor process status
-        with Live(console=console, refresh_per_second=1) as live:
+        # The table is only redrawn when a process changes state
+        from ui import Group, Live
+
+        with Live(console=console, auto_refresh=False) as live:
+            prev_key = None
             while True:
 
-                # Update process status table
-                status_table = create_process_status_table(processes, process_names)
-                live.update(status_table)
+                # Poll every process once per tick and split them into alive
+                # and terminated in the same pass
+                alive = []
+                dead = []
+                for st in procs:
+                    st.status = st.popen.poll()
+                    (alive if st.status is None else dead).append(st)
 
-                # Check for terminated processes
-                alive_processes = [p for p in processes if p.poll() is None]
+                # Update process status table
+                key = tuple((st.popen.pid, st.status is None) for st in procs)
+                if key != prev_key:
+                    live.update(create_process_status_table(procs), refresh=True)
+                    prev_key = key
 
-                if not alive_processes:
+                if not alive:
                     console.print("[warning]All processes have terminated[/warning]")
                     break
 
-                # Handle unexpected process termination
-                dead_processes = [p for p in processes if p.poll() is not None]
-                for p in dead_processes:
-                    idx = processes.index(p)
-                    console.print(
-                        f"[warning]Process '{name}' terminated unexpectedly[/warning]"
-                    )
+                # Handle unexpected process termination, one write per tick
+                if dead:
+                    warnings = [
+                        f"[warning]Process '{st.name}' terminated unexpectedly[/warning]"
+                        for st in dead
+                    ]
+                    console.print(Group(*warnings))
 
-                    # Remove the terminated process
-                    processes.pop(idx)
-                    process_names.pop(idx)
+                    # Keep only the processes that are still running
+                    procs = alive
 
-                time.sleep(1)  # Avoid busy waiting
+                # Sleep until an output stream ends or a server exits; the
+                # timeout is only a fallback check
+                state_changed.wait(timeout=1.0)
+                state_changed.clear()
 
     except KeyboardInterrupt:
         console.print("\n[yellow]Received shutdown signal[/yellow]")
 
     finally:
-        kill_servers(processes)
+        # The pipes are only closed once the servers are stopped, so output
+        # written while they shut down is still shown
+        with pipes:
+            # The pidfds are still needed to reap the servers during shutdown
+            kill_servers(procs, exit_selector)
+            if exit_selector is not None:
+                close_process_watch(exit_selector)
         console.print("[success]All servers stopped successfully[/success]")
 
 
@@ -0,0 +1,57 @@
+"""
+Rendering backend shared by the command builder, runner and viewer.
+
+Names are resolved lazily on first access, from the API-compatible
+``fast_rich`` package when it is installed and provides every submodule
+used here, otherwise all of them come from ``rich``. Classes from the two
+packages are never mixed.
+"""
+
+import importlib
+import importlib.util
+
+# Public name -> submodule that defines it in both backends
+_EXPORTS = {
+    "Console": "console",
+    "Group": "console",
+    "Live": "live",
+    "escape": "markup",
+    "Padding": "padding",
+    "Panel": "panel",
+    "Prompt": "prompt",
+    "Confirm": "prompt",
+    "Table": "table",
+    "Text": "text",
+    "Theme": "theme",
+}
+
+__all__ = list(_EXPORTS)
+
+_backend = None
+
+
+def _get_backend() -> str:
+    """Return the name of the rendering package to import from."""
+    global _backend
+    if _backend is None:
+        # find_spec only locates the submodules; they are imported on use
+        try:
+            complete = all(
+                importlib.util.find_spec(f"fast_rich.{submodule}") is not None
+                for submodule in set(_EXPORTS.values())
+            )
+        except ImportError:
+            complete = False  # fast_rich itself is not installed
+        _backend = "fast_rich" if complete else "rich"
+    return _backend
+
+
+def __getattr__(name):
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f"{_get_backend()}.{submodule}")
+    value = getattr(module, name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value